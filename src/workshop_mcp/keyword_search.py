@@ -159,7 +159,6 @@ class KeywordSearchTool:
                     result,
                     include_patterns,
                     exclude_patterns,
-                    case_insensitive,
                     skipped_files,
                 )
             )
@@ -212,7 +211,6 @@ class KeywordSearchTool:
         result: dict[str, Any],
         include_patterns: list[str] | None,
         exclude_patterns: list[str] | None,
-        case_insensitive: bool,
         skipped_files: list[str],
     ) -> None:
         """
@@ -221,11 +219,10 @@ class KeywordSearchTool:
         Args:
             root_path: Path to the directory to search
             keyword: The keyword to search for
-            pattern: Compiled regex pattern when use_regex is enabled
+            pattern: Compiled pattern for regex or case-insensitive searches
             result: Shared result dictionary to update
             include_patterns: Optional list of glob patterns to include files
             exclude_patterns: Optional list of glob patterns to exclude files
-            case_insensitive: Whether to perform a case-insensitive search
             skipped_files: List to track files skipped due to timeout
         """
         try:
@@ -256,7 +253,6 @@ class KeywordSearchTool:
                             keyword,
                             pattern,
                             result,
-                            case_insensitive,
                             skipped_files,
                         )
                     )
@@ -280,7 +276,6 @@ class KeywordSearchTool:
         keyword: str,
         pattern: regex.Pattern[str] | None,
         result: dict[str, Any],
-        case_insensitive: bool,
         skipped_files: list[str],
     ) -> None:
         """
@@ -289,9 +284,8 @@ class KeywordSearchTool:
         Args:
             file_path: Path to the file to search
             keyword: The keyword to search for
-            pattern: Compiled regex pattern when use_regex is enabled
+            pattern: Compiled pattern for regex or case-insensitive searches
             result: Shared result dictionary to update
-            case_insensitive: Whether to perform a case-insensitive search
             skipped_files: List to track files skipped due to timeout
         """
         file_path_str = str(file_path)
@@ -301,9 +295,7 @@ class KeywordSearchTool:
                 content = await file.read()
 
                 try:
-                    occurrences = self._count_occurrences(
-                        content, keyword, pattern, case_insensitive
-                    )
+                    occurrences = self._count_occurrences(content, keyword, pattern)
                 except TimeoutError:
                     # Regex operation timed out - skip this file and continue
                     self.logger.warning(f"Regex timeout on file: {file_path_str}")
@@ -357,10 +349,30 @@ class KeywordSearchTool:
     def _build_pattern(
         self, keyword: str, case_insensitive: bool, use_regex: bool
     ) -> regex.Pattern[str] | None:
+        """
+        Compile the search pattern once per search.
+
+        Case-insensitive literal searches are compiled from the escaped keyword
+        so each file reuses the same pattern instead of re-escaping per file.
+
+        Args:
+            keyword: The keyword to search for
+            case_insensitive: Whether to perform a case-insensitive search
+            use_regex: Whether keyword is treated as a regular expression
+
+        Returns:
+            Compiled pattern, or None for case-sensitive literal searches
+
+        Raises:
+            ValueError: If the regex pattern cannot be compiled
+        """
+        flags = regex.IGNORECASE if case_insensitive else 0
+
         if not use_regex:
+            if case_insensitive:
+                return regex.compile(regex.escape(keyword), flags=flags)
             return None
 
-        flags = regex.IGNORECASE if case_insensitive else 0
         try:
             return regex.compile(keyword, flags=flags)
         except regex.error:
@@ -371,7 +383,6 @@ class KeywordSearchTool:
         content: str,
         keyword: str,
         pattern: regex.Pattern[str] | None,
-        case_insensitive: bool,
     ) -> int:
         """
         Count occurrences of keyword in content.
@@ -379,8 +390,7 @@ class KeywordSearchTool:
         Args:
             content: File content to search
             keyword: The keyword to search for
-            pattern: Compiled regex pattern when use_regex is enabled
-            case_insensitive: Whether to perform a case-insensitive search
+            pattern: Compiled pattern for regex or case-insensitive searches
 
         Returns:
             Number of occurrences found
@@ -392,18 +402,6 @@ class KeywordSearchTool:
             # Use regex library with timeout for ReDoS protection
             # Use finditer instead of findall to avoid memory exhaustion on large match counts
             return sum(1 for _ in pattern.finditer(content, timeout=self.REGEX_TIMEOUT))
-        if case_insensitive:
-            # Use regex.finditer with IGNORECASE and timeout instead of content.lower()
-            # to avoid creating a full lowercase copy of large files
-            return sum(
-                1
-                for _ in regex.finditer(
-                    regex.escape(keyword),
-                    content,
-                    regex.IGNORECASE,
-                    timeout=self.REGEX_TIMEOUT,
-                )
-            )
         return content.count(keyword)
 
     def _should_exclude_dir(
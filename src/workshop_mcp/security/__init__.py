@@ -3,6 +3,9 @@
 This module provides security controls for input validation:
 - PathValidator: Prevents directory traversal attacks
 - validate_pattern: ReDoS protection for regex patterns
+- make_validator: validate_pattern specialized for a fixed use_regex value
+- validate_pattern_bytes: ReDoS protection for regex patterns held as bytes
+- validate_patterns: ReDoS protection for a batch of regex patterns
 - PathValidationError: Safe exception for path validation failures
 - RegexValidationError: Safe exception for regex validation failures
 - RegexTimeoutError: Exception for regex evaluation timeouts
@@ -38,7 +41,13 @@ from .exceptions import (
     SecurityValidationError,
 )
 from .path_validator import PathValidator
-from .regex_validator import MAX_PATTERN_LENGTH, validate_pattern
+from .regex_validator import (
+    MAX_PATTERN_LENGTH,
+    make_validator,
+    validate_pattern,
+    validate_pattern_bytes,
+    validate_patterns,
+)
 
 __all__ = [
     "MAX_PATTERN_LENGTH",
@@ -48,5 +57,8 @@ __all__ = [
     "RegexTimeoutError",
     "RegexValidationError",
     "SecurityValidationError",
+    "make_validator",
     "validate_pattern",
+    "validate_pattern_bytes",
+    "validate_patterns",
 ]
@@ -5,9 +5,12 @@ Regular Expression Denial of Service (ReDoS) attacks.
 
 Validation includes:
 - Pattern length limits
-- Detection of known ReDoS patterns (nested quantifiers)
+- Detection of ReDoS patterns (nested quantifiers, known overlapping alternations)
 - Syntax validation
 
+Outcomes are memoized per pattern, so validating the same pattern repeatedly
+costs a cache lookup rather than a fresh ReDoS scan and compile.
+
 Usage:
     from workshop_mcp.security.regex_validator import validate_pattern
 
@@ -19,30 +22,60 @@ Usage:
         return error_response(str(e))
 """
 
-from re import Pattern
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from itertools import pairwise
+from typing import Final
 
 import regex
 
 from .exceptions import RegexValidationError
 
 # Maximum allowed pattern length
-MAX_PATTERN_LENGTH: int = 500
+MAX_PATTERN_LENGTH: Final[int] = 500
+
+# Rejection messages, built once at import (safe to expose to clients)
+_LENGTH_ERROR_MESSAGE: str = f"Pattern exceeds maximum length ({MAX_PATTERN_LENGTH} characters)"
+_REDOS_ERROR_MESSAGE: str = "Pattern rejected: nested quantifiers detected"
+_KNOWN_REDOS_ERROR_MESSAGE: str = "Pattern rejected: known ReDoS pattern"
+_SYNTAX_ERROR_MESSAGE: str = "Invalid regex syntax"
+
+# Number of distinct patterns whose validation outcome is memoized
+_VALIDATION_CACHE_SIZE: int = 1024
+
+# Copy-pasted ReDoS patterns the structural scan misses: overlapping
+# alternations such as (a|aa)*, where several branches can match the same
+# text. They contain no nested quantifier, so they are rejected with
+# _KNOWN_REDOS_ERROR_MESSAGE after the scan.
+_KNOWN_REDOS_PATTERNS: frozenset[str] = frozenset(
+    {"(a|a)*", "(a|a)+", "(a|aa)*", "(a|aa)+", r"(.|\s)*", r"(\w|\d)+"}
+)
+
+# Common patterns known to be safe, accepted without scanning or compiling
+_KNOWN_SAFE_PATTERNS: frozenset[str] = frozenset(
+    {".*", ".+", "[a-z]+", "[A-Za-z]+", "[0-9]+", r"\d+", r"\w+", r"\s+", r"\b\w+\b"}
+)
 
-# Compiled patterns for detecting ReDoS vulnerabilities
-# These detect nested quantifiers: (x+)+, (x*)+, (x+)*, (x*)*, etc.
-# Both capturing and non-capturing groups
-_REDOS_PATTERNS: list[Pattern[str]] = [
-    # Nested quantifiers: group with inner quantifier + outer quantifier
-    # Matches: (a+)+, (.*)+, (.+)*, (a*)*, (?:a+)+, etc.
-    regex.compile(r"\([^)]*[+*][^)]*\)[+*]"),
-]
+# Quantifiers that can make a group repeat unboundedly: (x+)+, (x*)+, (x+)*, (x*)*
+_QUANTIFIERS: tuple[str, ...] = ("+", "*")
+
+# Escape sequences that match literal characters but look structural to the
+# scan. Escaped backslashes come first so "\\(" is read as "\\" then "(".
+_ESCAPED_LITERALS: tuple[str, ...] = ("\\\\", "\\(", "\\)", "\\+", "\\*")
 
 
 def _is_redos_pattern(pattern: str) -> bool:
     """Check if pattern contains known ReDoS constructs.
 
     Detects patterns with nested quantifiers that can cause
-    exponential backtracking.
+    exponential backtracking: a group (capturing or not) containing
+    a quantifier and followed by another quantifier.
+
+    The scan splits on ")" and inspects each group body with C-level
+    string methods, so it runs in linear time. A backtracking regex
+    detector is itself superlinear on inputs like "((((...++++".
+    Escaped parentheses and quantifiers are blanked out first so literal
+    characters such as "\\(a+\\)+" are not mistaken for groups.
 
     Args:
         pattern: The regex pattern string to check.
@@ -50,20 +83,65 @@ def _is_redos_pattern(pattern: str) -> bool:
     Returns:
         True if the pattern contains ReDoS-vulnerable constructs.
     """
-    for redos_pattern in _REDOS_PATTERNS:
-        if redos_pattern.search(pattern):
+    if "\\" in pattern:
+        for escaped in _ESCAPED_LITERALS:
+            pattern = pattern.replace(escaped, "\0\0")
+
+    segments = pattern.split(")")
+    for group_body, following in pairwise(segments):
+        if not following.startswith(_QUANTIFIERS):
+            continue
+        open_index = group_body.find("(")
+        if open_index == -1:
+            continue
+        if any(group_body.find(q, open_index + 1) != -1 for q in _QUANTIFIERS):
             return True
     return False
 
 
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _check_regex_pattern(pattern: str | bytes) -> str | None:
+    """Run the ReDoS and syntax checks for a length-checked pattern.
+
+    Results are memoized, so only patterns within MAX_PATTERN_LENGTH should
+    be passed in to keep the cache bounded.
+
+    Args:
+        pattern: The regex pattern to check, as str or bytes.
+
+    Returns:
+        The rejection message if the pattern is unsafe or invalid, else None.
+    """
+    # Check for ReDoS patterns. Bytes are checked through a latin-1 view,
+    # which maps each byte to one code point without UTF-8 decoding, so the
+    # str and bytes entry points share the blocklist and the structural scan.
+    scan_text = pattern if isinstance(pattern, str) else pattern.decode("latin-1")
+    if _is_redos_pattern(scan_text):
+        return _REDOS_ERROR_MESSAGE
+    if scan_text in _KNOWN_REDOS_PATTERNS:
+        return _KNOWN_REDOS_ERROR_MESSAGE
+
+    # Validate regex syntax using regex library (same as execution engine).
+    # A stdlib parse-only check (sre_parse) would reject valid regex-only
+    # syntax such as \p{L}; the full compile runs once per pattern thanks to
+    # memoization and seeds regex's own cache for the search that follows.
+    try:
+        regex.compile(pattern)
+    except regex.error:
+        return _SYNTAX_ERROR_MESSAGE
+
+    return None
+
+
 def validate_pattern(pattern: str, use_regex: bool) -> None:
     """Validate a regex pattern for safety before execution.
 
-    Performs validation in order:
+    Performs validation in order, cheapest checks first:
     1. If use_regex is False, skip all validation (literal string)
-    2. Check pattern length (max 500 characters)
-    3. Check for known ReDoS patterns (nested quantifiers)
-    4. Validate regex syntax
+    2. Check pattern length (max 500 characters); empty patterns pass
+    3. Look up well-known safe patterns
+    4. Check for nested quantifiers, then known overlapping alternations
+    5. Validate regex syntax
 
     Args:
         pattern: The pattern string to validate.
@@ -81,18 +159,111 @@ def validate_pattern(pattern: str, use_regex: bool) -> None:
     if not use_regex:
         return
 
+    _validate_regex_pattern(pattern)
+
+
+def _validate_regex_pattern(pattern: str) -> None:
+    """Validate a pattern known to be used as a regex.
+
+    Holds the regex-mode checks of validate_pattern so callers that already
+    know use_regex is True (such as validate_patterns) skip the mode branch.
+
+    Args:
+        pattern: The regex pattern string to validate.
+
+    Raises:
+        RegexValidationError: If validation fails for any reason.
+    """
+    # Check pattern length
+    pattern_length = len(pattern)
+    if pattern_length > MAX_PATTERN_LENGTH:
+        raise RegexValidationError(_LENGTH_ERROR_MESSAGE)
+
+    # Empty pattern is trivially valid; skip the scan and cache lookup
+    if pattern_length == 0:
+        return
+
+    # Constant-time lookup for well-known safe patterns
+    if pattern in _KNOWN_SAFE_PATTERNS:
+        return
+
+    # ReDoS and syntax checks (memoized per pattern)
+    error_message = _check_regex_pattern(pattern)
+    if error_message is not None:
+        raise RegexValidationError(error_message)
+
+
+def _skip_validation(pattern: str) -> None:
+    """Accept any pattern; used for literal (non-regex) searches."""
+
+
+def make_validator(use_regex: bool) -> Callable[[str], None]:
+    """Return a validator specialized for a fixed use_regex value.
+
+    Callers that validate many patterns with the same mode can resolve the
+    mode once, outside their loop, instead of branching on every call.
+
+    Args:
+        use_regex: If True, the validator checks patterns as regex. If False,
+                   it accepts every pattern (literal mode).
+
+    Returns:
+        A function taking a pattern that raises RegexValidationError when the
+        pattern is rejected.
+
+    Example:
+        >>> check = make_validator(use_regex=True)
+        >>> check("a+b+")  # OK
+        >>> check("(a+)+")  # Raises
+    """
+    return _validate_regex_pattern if use_regex else _skip_validation
+
+
+def validate_pattern_bytes(pattern: bytes, use_regex: bool) -> None:
+    """Validate a bytes regex pattern for safety before execution.
+
+    Mirrors validate_pattern for callers that already hold bytes, such as
+    patterns read from a file, so they need not decode first. The length
+    limit counts bytes, and syntax is checked as a bytes pattern because the
+    regex engine accepts different syntax for bytes than for str.
+
+    Args:
+        pattern: The pattern bytes to validate.
+        use_regex: If True, validate as regex. If False, treat as literal.
+
+    Raises:
+        RegexValidationError: If validation fails for any reason.
+    """
+    # Non-regex mode: skip all validation
+    if not use_regex:
+        return
+
     # Check pattern length
     if len(pattern) > MAX_PATTERN_LENGTH:
-        raise RegexValidationError(
-            f"Pattern exceeds maximum length ({MAX_PATTERN_LENGTH} characters)"
-        )
+        raise RegexValidationError(_LENGTH_ERROR_MESSAGE)
 
-    # Check for ReDoS patterns
-    if _is_redos_pattern(pattern):
-        raise RegexValidationError("Pattern rejected: nested quantifiers detected")
+    # ReDoS and syntax checks (memoized per pattern)
+    error_message = _check_regex_pattern(pattern)
+    if error_message is not None:
+        raise RegexValidationError(error_message)
 
-    # Validate regex syntax using regex library (same as execution engine)
-    try:
-        regex.compile(pattern)
-    except regex.error:
-        raise RegexValidationError("Invalid regex syntax")
+
+def validate_patterns(patterns: Iterable[str], use_regex: bool) -> None:
+    """Validate multiple patterns, failing fast on the first invalid pattern.
+
+    Duplicate patterns are validated once, and each distinct pattern goes
+    through the memoized checks used by validate_pattern, so validating a
+    large rule set that repeats patterns costs one scan per distinct pattern.
+
+    Args:
+        patterns: The pattern strings to validate.
+        use_regex: If True, validate as regex. If False, treat as literal.
+
+    Raises:
+        RegexValidationError: If any pattern fails validation.
+    """
+    if not use_regex:
+        return
+
+    for pattern in dict.fromkeys(patterns):
+        _validate_regex_pattern(pattern)
@@ -46,6 +46,42 @@ class JsonRpcError(Exception):
         return self.message
 
 
+# Tool exceptions answered with a fixed message so their details stay server-side.
+_SANITIZED_ERRORS: tuple[tuple[type[Exception], str], ...] = (
+    (ValueError, "Invalid parameters"),
+    (FileNotFoundError, "Resource not found"),
+    (SyntaxError, "Invalid source code syntax"),
+    (KeyError, "Missing required argument"),
+)
+
+
+def _error_for_exception(exc: Exception, tool_name: str) -> JsonRpcError:
+    """Map an exception raised while executing a tool to a client-safe error.
+
+    Security validation errors keep their message, which is safe by design.
+    Known error types get a fixed generic message, and anything else becomes
+    an internal error carrying only the correlation ID. Call this from inside
+    the ``except`` block handling ``exc`` so unexpected errors are logged with
+    their traceback.
+
+    Args:
+        exc: The exception raised by the tool.
+        tool_name: Name of the tool, used in log messages.
+
+    Returns:
+        The JSON-RPC error to send to the client.
+    """
+    if isinstance(exc, SecurityValidationError):
+        logger.warning("Security validation error: %s", exc)
+        return JsonRpcError(-32602, str(exc))
+    for exc_type, message in _SANITIZED_ERRORS:
+        if isinstance(exc, exc_type):
+            logger.warning("%s in %s: %s", exc_type.__name__, tool_name, exc)
+            return JsonRpcError(-32602, message)
+    logger.exception("Error executing %s", tool_name)
+    return JsonRpcError(-32603, "Internal error", {"correlation_id": correlation_id_var.get()})
+
+
 class WorkshopMCPServer:
     """
     MCP Server implementation for the Workshop Keyword Search Tool.
@@ -409,40 +445,8 @@ class WorkshopMCPServer:
                 "content": [{"type": "text", "text": result_json}],
             }
             return self._success_response(request_id, payload)
-        except ValueError as exc:
-            logger.warning("ValueError in keyword_search: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, "Invalid parameters"),
-            )
-        except FileNotFoundError as exc:
-            logger.warning("FileNotFoundError in keyword_search: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, "Resource not found"),
-            )
-        except KeyError as exc:
-            logger.warning("KeyError in keyword_search: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, "Missing required argument"),
-            )
-        except SecurityValidationError as exc:
-            logger.warning("Security validation error: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, str(exc)),
-            )
-        except Exception:
-            logger.exception("Error executing keyword_search")
-            return self._error_response(
-                request_id,
-                JsonRpcError(
-                    -32603,
-                    "Internal error",
-                    {"correlation_id": correlation_id_var.get()},
-                ),
-            )
+        except Exception as exc:
+            return self._error_response(request_id, _error_for_exception(exc, "keyword_search"))
 
     def _execute_performance_check(
         self, request_id: Any, arguments: dict[str, Any]
@@ -530,46 +534,8 @@ class WorkshopMCPServer:
             }
             return self._success_response(request_id, result)
 
-        except ValueError as exc:
-            logger.warning("ValueError in performance_check: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, "Invalid parameters"),
-            )
-        except FileNotFoundError as exc:
-            logger.warning("FileNotFoundError in performance_check: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, "Resource not found"),
-            )
-        except SyntaxError as exc:
-            logger.warning("SyntaxError in performance_check: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, "Invalid source code syntax"),
-            )
-        except KeyError as exc:
-            logger.warning("KeyError in performance_check: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, "Missing required argument"),
-            )
-        except SecurityValidationError as exc:
-            logger.warning("Security validation error: %s", exc)
-            return self._error_response(
-                request_id,
-                JsonRpcError(-32602, str(exc)),
-            )
-        except Exception:
-            logger.exception("Error executing performance_check")
-            return self._error_response(
-                request_id,
-                JsonRpcError(
-                    -32603,
-                    "Internal error",
-                    {"correlation_id": correlation_id_var.get()},
-                ),
-            )
+        except Exception as exc:
+            return self._error_response(request_id, _error_for_exception(exc, "performance_check"))
 
     def _success_response(self, request_id: Any, result: dict[str, Any]) -> dict[str, Any]:
         return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
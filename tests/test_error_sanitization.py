@@ -4,147 +4,171 @@ These tests verify that:
 1. Internal error details (paths, stack traces) are NOT leaked to clients
 2. SecurityValidationError subclasses pass through their safe messages
 3. Full debugging information is only available in server logs with correlation IDs
+
+Each test gets its own tmp_path and allowed roots, and all patching goes through
+monkeypatch, so the module is safe to run in parallel. Under pytest-xdist, use
+``--dist=loadfile`` so each worker builds the module-scoped server only once.
 """
 
+import copy
 import json
+import logging
+from collections.abc import Callable, Iterator
 from io import BytesIO
-from unittest.mock import patch
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import pytest
 
 from workshop_mcp.security import (
+    PathValidator,
     RegexAbortError,
     RegexTimeoutError,
     RegexValidationError,
     SecurityValidationError,
 )
-from workshop_mcp.server import WorkshopMCPServer
+from workshop_mcp.server import JsonRpcError, WorkshopMCPServer, _error_for_exception
+
+EXPECTED_PATH_MSG = "outside allowed directories"
+
+_REQUEST_TEMPLATE = MappingProxyType({"jsonrpc": "2.0", "id": 1, "method": "call_tool"})
+
+
+def _call_tool_request(name: str, **arguments: Any) -> dict[str, Any]:
+    """Build a call_tool JSON-RPC request for the named tool."""
+    return {**_REQUEST_TEMPLATE, "params": {"name": name, "arguments": arguments}}
+
+
+def _raising(error: Exception) -> Callable[..., Any]:
+    """Build a stand-in for a tool's execute method that raises error."""
+
+    def execute(*args: Any, **kwargs: Any) -> Any:
+        raise error
+
+    return execute
+
+
+@pytest.fixture(scope="module")
+def shared_server() -> Iterator[WorkshopMCPServer]:
+    """Build one server for the whole module instead of one per test."""
+    server = WorkshopMCPServer()
+    yield server
+    server.loop.close()
+
+
+@pytest.fixture
+def server(
+    shared_server: WorkshopMCPServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> WorkshopMCPServer:
+    """Return the shared server with allowed roots limited to this test's tmp_path."""
+    monkeypatch.setattr(shared_server, "path_validator", PathValidator(allowed_roots=[tmp_path]))
+    return shared_server
+
+
+@pytest.fixture
+def search_request(tmp_path: Path) -> dict[str, Any]:
+    """Build a keyword_search request rooted at this test's tmp_path."""
+    return _call_tool_request("keyword_search", keyword="test", root_paths=[str(tmp_path)])
+
+
+class TestErrorMapping:
+    """Test the exception-to-error mapping directly, without a server."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (ValueError("bad /secret/path"), JsonRpcError(-32602, "Invalid parameters")),
+            (FileNotFoundError("/secret/config.json"), JsonRpcError(-32602, "Resource not found")),
+            (SyntaxError("line 3"), JsonRpcError(-32602, "Invalid source code syntax")),
+            (KeyError("api_key"), JsonRpcError(-32602, "Missing required argument")),
+            (RegexValidationError("foo"), JsonRpcError(-32602, "foo")),
+            (RegexTimeoutError(), JsonRpcError(-32602, "Pattern evaluation timed out")),
+        ],
+    )
+    def test_known_errors_map_to_invalid_params(self, error, expected):
+        """Known and security errors map to -32602 with a client-safe message."""
+        assert _error_for_exception(error, "keyword_search") == expected
+
+    def test_unexpected_error_maps_to_internal_error(self):
+        """Unexpected errors map to -32603 carrying only the correlation ID."""
+        try:
+            raise RuntimeError("secret.db password xyz")
+        except RuntimeError as exc:
+            error = _error_for_exception(exc, "keyword_search")
+
+        assert error.code == -32603
+        assert error.message == "Internal error"
+        assert error.data is not None
+        assert set(error.data) == {"correlation_id"}
 
 
 class TestErrorSanitization:
     """Test that exception details are sanitized in client responses."""
 
-    def test_valueerror_returns_generic_message(self, tmp_path, monkeypatch):
+    def test_valueerror_returns_generic_message(
+        self, server, tmp_path, search_request, monkeypatch
+    ):
         """ValueError returns 'Invalid parameters' without revealing details."""
-        monkeypatch.setenv("MCP_ALLOWED_ROOTS", str(tmp_path))
-        server = WorkshopMCPServer()
-
-        with patch.object(
+        monkeypatch.setattr(
             server.keyword_search_tool,
             "execute",
-            side_effect=ValueError(f"Invalid value for path {tmp_path}/secret/internal.py"),
-        ):
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "call_tool",
-                "params": {
-                    "name": "keyword_search",
-                    "arguments": {"keyword": "test", "root_paths": [str(tmp_path)]},
-                },
-            }
-            response = server._handle_request(request)
+            _raising(ValueError(f"Invalid value for path {tmp_path}/secret/internal.py")),
+        )
+        response = server._handle_request(search_request)
 
         assert response["error"]["message"] == "Invalid parameters"
         assert "secret" not in str(response["error"])
 
-    def test_filenotfounderror_returns_generic_message(self, tmp_path, monkeypatch):
+    def test_filenotfounderror_returns_generic_message(self, server, search_request, monkeypatch):
         """FileNotFoundError returns 'Resource not found' without revealing path."""
-        monkeypatch.setenv("MCP_ALLOWED_ROOTS", str(tmp_path))
-        server = WorkshopMCPServer()
-
-        with patch.object(
+        monkeypatch.setattr(
             server.keyword_search_tool,
             "execute",
-            side_effect=FileNotFoundError("/home/user/sensitive/data/config.json"),
-        ):
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "call_tool",
-                "params": {
-                    "name": "keyword_search",
-                    "arguments": {"keyword": "test", "root_paths": [str(tmp_path)]},
-                },
-            }
-            response = server._handle_request(request)
+            _raising(FileNotFoundError("/home/user/sensitive/data/config.json")),
+        )
+        response = server._handle_request(search_request)
 
         assert response["error"]["message"] == "Resource not found"
         assert "sensitive" not in str(response["error"])
 
-    def test_syntaxerror_returns_generic_message(self):
+    def test_syntaxerror_returns_generic_message(self, server):
         """SyntaxError returns 'Invalid source code syntax' without details."""
-        server = WorkshopMCPServer()
-
-        request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "call_tool",
-            "params": {
-                "name": "performance_check",
-                "arguments": {"source_code": "def foo(:\n    pass"},
-            },
-        }
+        request = _call_tool_request("performance_check", source_code="def foo(:\n    pass")
         response = server._handle_request(request)
 
         assert response["error"]["message"] == "Invalid source code syntax"
         assert "line" not in response["error"]["message"].lower()
 
-    def test_keyerror_returns_generic_message(self, tmp_path, monkeypatch):
+    def test_keyerror_returns_generic_message(self, server, search_request, monkeypatch):
         """KeyError returns 'Missing required argument' without key name."""
-        monkeypatch.setenv("MCP_ALLOWED_ROOTS", str(tmp_path))
-        server = WorkshopMCPServer()
-
-        with patch.object(
-            server.keyword_search_tool,
-            "execute",
-            side_effect=KeyError("internal_config_api_key"),
-        ):
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "call_tool",
-                "params": {
-                    "name": "keyword_search",
-                    "arguments": {"keyword": "test", "root_paths": [str(tmp_path)]},
-                },
-            }
-            response = server._handle_request(request)
+        monkeypatch.setattr(
+            server.keyword_search_tool, "execute", _raising(KeyError("internal_config_api_key"))
+        )
+        response = server._handle_request(search_request)
 
         assert response["error"]["message"] == "Missing required argument"
         assert "api_key" not in str(response["error"])
 
-    def test_internal_error_has_correlation_id_no_details(self, tmp_path, monkeypatch):
+    def test_internal_error_has_correlation_id_no_details(
+        self, server, search_request, monkeypatch
+    ):
         """Internal errors include correlation_id but not exception details."""
-        monkeypatch.setenv("MCP_ALLOWED_ROOTS", str(tmp_path))
-        server = WorkshopMCPServer()
-
         revealing_error = "Database connection to secret.db failed with password xyz"
-        with patch.object(
-            server.keyword_search_tool,
-            "execute",
-            side_effect=RuntimeError(revealing_error),
-        ):
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "call_tool",
-                "params": {
-                    "name": "keyword_search",
-                    "arguments": {"keyword": "test", "root_paths": [str(tmp_path)]},
-                },
-            }
-            request_bytes = json.dumps(request).encode("utf-8")
-            request_message = (
-                f"Content-Length: {len(request_bytes)}\r\n\r\n".encode() + request_bytes
-            )
-
-            stdin = BytesIO(request_message)
-            stdout = BytesIO()
-            server.serve_once(stdin, stdout)
-
-            stdout.seek(0)
-            response_data = stdout.read()
-            header_end = response_data.find(b"\r\n\r\n")
-            response = json.loads(response_data[header_end + 4 :].decode("utf-8"))
+        monkeypatch.setattr(
+            server.keyword_search_tool, "execute", _raising(RuntimeError(revealing_error))
+        )
+        request_bytes = json.dumps(search_request).encode("utf-8")
+        request_message = f"Content-Length: {len(request_bytes)}\r\n\r\n".encode() + request_bytes
+
+        stdin = BytesIO(request_message)
+        stdout = BytesIO()
+        server.serve_once(stdin, stdout)
+
+        stdout.seek(0)
+        response_data = stdout.read()
+        header_end = response_data.find(b"\r\n\r\n")
+        response = json.loads(response_data[header_end + 4 :].decode("utf-8"))
 
         assert response["error"]["code"] == -32603
         assert response["error"]["message"] == "Internal error"
@@ -152,99 +176,96 @@ class TestErrorSanitization:
         assert "correlation_id" in response["error"].get("data", {})
         assert len(response["error"]["data"]["correlation_id"]) == 8
 
+    def test_handler_does_not_mutate_request(self, server, search_request, monkeypatch):
+        """Handling a failing request leaves the request dict untouched."""
+        monkeypatch.setattr(server.keyword_search_tool, "execute", _raising(ValueError("bad")))
+        original = copy.deepcopy(search_request)
+        server._handle_request(search_request)
+
+        assert search_request == original
+
 
 class TestSecurityExceptionPassthrough:
     """Test that SecurityValidationError subclasses pass through safe messages."""
 
-    def test_regex_validation_error_passthrough(self, tmp_path, monkeypatch):
-        """RegexValidationError returns -32602 with its safe message."""
-        monkeypatch.setenv("MCP_ALLOWED_ROOTS", str(tmp_path))
-        server = WorkshopMCPServer()
-
-        with patch.object(
-            server.keyword_search_tool,
-            "execute",
-            side_effect=RegexValidationError("Pattern rejected: nested quantifiers detected"),
-        ):
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "call_tool",
-                "params": {
-                    "name": "keyword_search",
-                    "arguments": {
-                        "keyword": "(a+)+$",
-                        "root_paths": [str(tmp_path)],
-                        "use_regex": True,
-                    },
-                },
-            }
-            response = server._handle_request(request)
+    @pytest.mark.parametrize(
+        ("execute", "expected_message"),
+        [
+            (
+                _raising(RegexValidationError("Pattern rejected: nested quantifiers detected")),
+                "Pattern rejected: nested quantifiers detected",
+            ),
+            (_raising(RegexValidationError()), "Invalid regex pattern"),
+            (_raising(RegexAbortError()), "Pattern timed out on too many files"),
+            (_raising(RegexTimeoutError()), "Pattern evaluation timed out"),
+            (_raising(SecurityValidationError("Generic security error")), "Generic security error"),
+        ],
+    )
+    def test_security_error_passthrough(
+        self, server, search_request, monkeypatch, execute, expected_message
+    ):
+        """SecurityValidationError subclasses return -32602 with their safe message."""
+        monkeypatch.setattr(server.keyword_search_tool, "execute", execute)
+        response = server._handle_request(search_request)
 
         assert response["error"]["code"] == -32602
-        assert response["error"]["message"] == "Pattern rejected: nested quantifiers detected"
-
-    def test_regex_abort_and_timeout_errors_passthrough(self, tmp_path, monkeypatch):
-        """RegexAbortError and RegexTimeoutError pass through safe messages."""
-        monkeypatch.setenv("MCP_ALLOWED_ROOTS", str(tmp_path))
-        server = WorkshopMCPServer()
-
-        for error_class, expected_msg in [
-            (RegexAbortError, "Pattern timed out on too many files"),
-            (RegexTimeoutError, "Pattern evaluation timed out"),
-        ]:
-            with patch.object(server.keyword_search_tool, "execute", side_effect=error_class()):
-                request = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "call_tool",
-                    "params": {
-                        "name": "keyword_search",
-                        "arguments": {"keyword": "test", "root_paths": [str(tmp_path)]},
-                    },
-                }
-                response = server._handle_request(request)
-
-            assert response["error"]["code"] == -32602
-            assert response["error"]["message"] == expected_msg
-
-    def test_path_validation_error_passthrough(self, tmp_path, monkeypatch):
+        assert response["error"]["message"] == expected_message
+        assert json.loads(json.dumps(response)) == response
+
+    @pytest.mark.xfail(
+        strict=True,
+        reason="JSON-RPC batch arrays are not part of MCP 2024-11-05, the protocol we advertise",
+    )
+    def test_batch_of_security_errors(self, server, search_request, monkeypatch):
+        """A batch of failing requests yields one safe error response per request."""
+        monkeypatch.setattr(server.keyword_search_tool, "execute", _raising(RegexTimeoutError()))
+        batch = [{**search_request, "id": request_id} for request_id in range(16)]
+        responses = server._handle_request(batch)
+
+        assert isinstance(responses, list)
+        assert [response["id"] for response in responses] == list(range(16))
+        assert all(response["error"]["code"] == -32602 for response in responses)
+
+    def test_path_validation_error_passthrough(self, server):
         """PathValidationError returns safe message without revealing path."""
-        monkeypatch.setenv("MCP_ALLOWED_ROOTS", str(tmp_path))
-        server = WorkshopMCPServer()
-
-        request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "call_tool",
-            "params": {"name": "performance_check", "arguments": {"file_path": "/etc/passwd"}},
-        }
+        request = _call_tool_request("performance_check", file_path="/etc/passwd")
         response = server._handle_request(request)
 
         assert response["error"]["code"] == -32602
-        assert "outside allowed directories" in response["error"]["message"]
+        assert EXPECTED_PATH_MSG in response["error"]["message"]
         assert "/etc/passwd" not in response["error"]["message"]
 
-    def test_base_security_error_passthrough(self, tmp_path, monkeypatch):
-        """Base SecurityValidationError passes through its message."""
-        monkeypatch.setenv("MCP_ALLOWED_ROOTS", str(tmp_path))
-        server = WorkshopMCPServer()
 
-        with patch.object(
+class TestServerLogging:
+    """Test that details withheld from clients are still logged server-side."""
+
+    @pytest.fixture(autouse=True)
+    def _capture_warnings(self, caplog):
+        """Capture server warnings and errors for every test in this class."""
+        caplog.set_level(logging.WARNING, logger="workshop_mcp.server")
+
+    def test_security_error_is_logged(self, server, search_request, monkeypatch, caplog):
+        """Security validation errors are logged with their message."""
+        monkeypatch.setattr(
             server.keyword_search_tool,
             "execute",
-            side_effect=SecurityValidationError("Generic security error"),
-        ):
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "call_tool",
-                "params": {
-                    "name": "keyword_search",
-                    "arguments": {"keyword": "test", "root_paths": [str(tmp_path)]},
-                },
-            }
-            response = server._handle_request(request)
+            _raising(RegexValidationError("Pattern rejected: nested quantifiers detected")),
+        )
+        server._handle_request(search_request)
 
-        assert response["error"]["code"] == -32602
-        assert response["error"]["message"] == "Generic security error"
+        joined = "\n".join(record.message for record in caplog.records)
+        assert "Security validation error" in joined or "nested quantifiers" in joined
+
+    def test_internal_error_details_are_logged(self, server, search_request, monkeypatch, caplog):
+        """Internal error details are logged even though the client sees a generic message."""
+        revealing_error = "Database connection to secret.db failed with password xyz"
+        monkeypatch.setattr(
+            server.keyword_search_tool, "execute", _raising(RuntimeError(revealing_error))
+        )
+        response = server._handle_request(search_request)
+
+        assert "secret.db" not in str(response["error"])
+        assert any(
+            record.exc_info is not None and "secret.db" in str(record.exc_info[1])
+            for record in caplog.records
+        )
@@ -9,8 +9,10 @@ from pathlib import Path
 
 import pytest
 import pytest_asyncio
+import regex
 
 from workshop_mcp.keyword_search import KeywordSearchTool
+from workshop_mcp.security import validate_pattern
 
 
 @pytest_asyncio.fixture
@@ -70,12 +72,45 @@ class TestKeywordSearchBasics:
             >= result_lower["summary"]["total_occurrences"]
         )
 
+    @pytest.mark.asyncio
+    async def test_case_insensitive_literal_escapes_metacharacters(self, search_tool, tmp_path):
+        """Test case-insensitive literal search treats regex metacharacters literally."""
+        (tmp_path / "sample.py").write_text("A.B a.b axb")
+
+        result = await search_tool.execute("a.b", [str(tmp_path)], case_insensitive=True)
+
+        assert result["summary"]["total_occurrences"] == 2
+
     @pytest.mark.asyncio
     async def test_regex_search(self, search_tool, temp_test_directory):
         """Test regex pattern matching."""
         result = await search_tool.execute(r"w.rld", [str(temp_test_directory)], use_regex=True)
         assert result["summary"]["total_occurrences"] > 0
 
+    @pytest.mark.asyncio
+    async def test_regex_compiled_once_per_search(self, search_tool, tmp_path, monkeypatch):
+        """Test the search pattern is compiled once per search, not once per file."""
+        for index in range(20):
+            (tmp_path / f"file{index}.py").write_text("hello helllo")
+        # Warm the validator's memo so only the search itself reaches regex.compile
+        validate_pattern("hel+o", use_regex=True)
+
+        compile_calls = []
+        original_compile = regex.compile
+
+        def counting_compile(*args, **kwargs):
+            compile_calls.append(args)
+            return original_compile(*args, **kwargs)
+
+        monkeypatch.setattr(regex, "compile", counting_compile)
+
+        searches = 5
+        for _ in range(searches):
+            result = await search_tool.execute("hel+o", [str(tmp_path)], use_regex=True)
+            assert result["summary"]["total_occurrences"] == 40
+
+        assert len(compile_calls) == searches
+
     @pytest.mark.asyncio
     async def test_include_exclude_patterns(self, search_tool, temp_test_directory):
         """Test file filtering with include/exclude patterns."""
@@ -5,6 +5,10 @@ import pytest
 from workshop_mcp.performance_profiler.patterns import IssueCategory, Severity
 from workshop_mcp.performance_profiler.performance_checker import PerformanceChecker
 
+EXPECTED_CATEGORIES = frozenset(
+    {IssueCategory.N_PLUS_ONE_QUERY, IssueCategory.BLOCKING_IO_IN_ASYNC}
+)
+
 
 class TestPerformanceCheckerInitialization:
     """Test performance checker initialization."""
@@ -192,8 +196,7 @@ async def process():
         issues = checker.check_all()
 
         assert len(issues) >= 3
-        categories = {i.category for i in issues}
-        assert len(categories) >= 2
+        assert EXPECTED_CATEGORIES.issubset({i.category for i in issues})
 
     def test_get_issues_by_severity_and_category(self):
         """Test filtering issues by severity and category."""
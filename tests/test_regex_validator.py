@@ -5,14 +5,28 @@ Tests cover:
 - ReDoS pattern detection (nested quantifiers)
 - Regex syntax validation
 - Non-regex mode bypass
+- Memoization of validation outcomes
+- Batch validation
+- Bytes pattern validation
+- Mode-specialized validators
 """
 
+import time
+
 import pytest
 
 from workshop_mcp.security.exceptions import (
     RegexValidationError,
 )
-from workshop_mcp.security.regex_validator import MAX_PATTERN_LENGTH, validate_pattern
+from workshop_mcp.security.regex_validator import (
+    MAX_PATTERN_LENGTH,
+    _check_regex_pattern,
+    _is_redos_pattern,
+    make_validator,
+    validate_pattern,
+    validate_pattern_bytes,
+    validate_patterns,
+)
 
 
 class TestPatternLengthValidation:
@@ -21,9 +35,8 @@ class TestPatternLengthValidation:
     def test_pattern_exceeding_max_length_raises_error(self) -> None:
         """Pattern longer than 500 characters should raise RegexValidationError."""
         long_pattern = "a" * 501
-        with pytest.raises(RegexValidationError) as exc_info:
+        with pytest.raises(RegexValidationError, match="Pattern exceeds maximum length"):
             validate_pattern(long_pattern, use_regex=True)
-        assert "Pattern exceeds maximum length" in str(exc_info.value)
 
     def test_pattern_at_max_length_passes(self) -> None:
         """Pattern at exactly 500 characters should pass."""
@@ -34,66 +47,224 @@ class TestPatternLengthValidation:
 class TestRedosPatternDetection:
     """Test detection of ReDoS patterns (nested quantifiers)."""
 
-    def test_nested_quantifiers_rejected(self) -> None:
+    @pytest.mark.parametrize("pattern", ["(a+)+", "(.*)+", "(.+)*", "(?:a+)+", "(a*)*"])
+    def test_nested_quantifiers_rejected(self, pattern: str) -> None:
         """Patterns with nested quantifiers should be rejected as ReDoS."""
-        redos_patterns = ["(a+)+", "(.*)+", "(.+)*", "(?:a+)+", "(a*)*"]
-        for pattern in redos_patterns:
-            with pytest.raises(RegexValidationError) as exc_info:
-                validate_pattern(pattern, use_regex=True)
-            assert "nested quantifiers detected" in str(exc_info.value)
+        with pytest.raises(RegexValidationError, match="nested quantifiers detected"):
+            validate_pattern(pattern, use_regex=True)
 
-    def test_safe_quantifiers_allowed(self) -> None:
-        """Safe patterns with quantifiers should be allowed."""
-        safe_patterns = ["a+b+", ".*", ".+", "[a-z]+", "(a|b)+", r"\b\w+\b"]
-        for pattern in safe_patterns:
+    @pytest.mark.parametrize("pattern", ["(a|aa)*", "(a|a)+", r"(.|\s)*", r"(\w|\d)+"])
+    def test_known_overlapping_alternations_rejected(self, pattern: str) -> None:
+        """Well-known overlapping-alternation ReDoS patterns should be rejected."""
+        with pytest.raises(RegexValidationError, match="known ReDoS pattern"):
             validate_pattern(pattern, use_regex=True)
 
+    @pytest.mark.parametrize(
+        "pattern", ["a+b+", ".*", ".+", "[a-z]+", "(a|b)+", "(a|ab)*", r"\b\w+\b"]
+    )
+    def test_safe_quantifiers_allowed(self, pattern: str) -> None:
+        """Safe patterns with quantifiers should be allowed."""
+        validate_pattern(pattern, use_regex=True)
+
+    def test_quantifier_after_separate_group_allowed(self) -> None:
+        """A quantified group is only flagged when its own body is quantified."""
+        assert not _is_redos_pattern("(a+)(b)+")
+        assert not _is_redos_pattern("(" * 250 + "+" * 250)
+        assert _is_redos_pattern("x(y)(z*)*")
+
+    @pytest.mark.parametrize("pattern", [r"\(a+\)+", r"(a\+)+", r"(a\*)*", r"\\\(a+\)+"])
+    def test_escaped_metacharacters_not_flagged(self, pattern: str) -> None:
+        """Escaped parentheses and quantifiers are literals, not nested groups."""
+        validate_pattern(pattern, use_regex=True)
+
+    def test_escaped_backslash_before_group_still_flagged(self) -> None:
+        """An escaped backslash does not hide the group that follows it."""
+        assert _is_redos_pattern(r"\\(a+)+")
+
+    @pytest.mark.parametrize("pattern", ["(" * 50_000 + "+" * 50_000, "(+" * 50_000])
+    def test_detector_is_linear_on_adversarial_input(self, pattern: str) -> None:
+        """The detector must not backtrack on long unbalanced input."""
+        start = time.perf_counter()
+        assert not _is_redos_pattern(pattern)
+        assert time.perf_counter() - start < 1.0
+
 
 class TestSyntaxValidation:
     """Test regex syntax validation."""
 
-    def test_invalid_syntax_rejected(self) -> None:
+    @pytest.mark.parametrize("pattern", ["[invalid", "(unclosed", r"\x", "a{3,2}"])
+    def test_invalid_syntax_rejected(self, pattern: str) -> None:
         """Patterns with invalid syntax should be rejected."""
-        invalid_patterns = ["[invalid", "(unclosed", r"\x", "a{3,2}"]
-        for pattern in invalid_patterns:
-            with pytest.raises(RegexValidationError) as exc_info:
-                validate_pattern(pattern, use_regex=True)
-            assert "Invalid regex syntax" in str(exc_info.value)
+        with pytest.raises(RegexValidationError, match="Invalid regex syntax"):
+            validate_pattern(pattern, use_regex=True)
 
-    def test_valid_syntax_passes(self) -> None:
-        """Valid regex patterns should pass."""
-        valid_patterns = [
+    @pytest.mark.parametrize(
+        "pattern",
+        [
             "[a-z]+",
             "(foo|bar)+",
             r"\.\*\+\?",
             r"[\w.+-]+@[\w-]+\.[\w.-]+",
             r"foo(?=bar)",
-        ]
-        for pattern in valid_patterns:
-            validate_pattern(pattern, use_regex=True)
+        ],
+    )
+    def test_valid_syntax_passes(self, pattern: str) -> None:
+        """Valid regex patterns should pass."""
+        validate_pattern(pattern, use_regex=True)
+
+    @pytest.mark.parametrize("pattern", [r"\p{L}+", r"\X", r"(?V1)[[a-z]--[aeiou]]"])
+    def test_regex_module_syntax_passes(self, pattern: str) -> None:
+        """Syntax supported by the regex engine but not stdlib re should pass."""
+        validate_pattern(pattern, use_regex=True)
 
 
 class TestNonRegexMode:
     """Test non-regex mode behavior."""
 
-    def test_non_regex_mode_skips_all_validation(self) -> None:
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "a" * 1000,  # Long pattern - would fail length check
+            "(a+)+",  # ReDoS pattern - would fail nested quantifier check
+            "[invalid",  # Invalid syntax - would fail syntax check
+        ],
+    )
+    def test_non_regex_mode_skips_all_validation(self, pattern: str) -> None:
         """Non-regex mode should skip all validation."""
-        # Long pattern - would fail length check
-        validate_pattern("a" * 1000, use_regex=False)
-        # ReDoS pattern - would fail nested quantifier check
-        validate_pattern("(a+)+", use_regex=False)
-        # Invalid syntax - would fail syntax check
-        validate_pattern("[invalid", use_regex=False)
+        validate_pattern(pattern, use_regex=False)
 
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_empty_string_passes(self) -> None:
+    @pytest.mark.parametrize("use_regex", [True, False])
+    def test_empty_string_passes(self, use_regex: bool) -> None:
         """Empty string should pass in both modes."""
+        validate_pattern("", use_regex=use_regex)
+
+    def test_known_safe_pattern_skips_cache(self) -> None:
+        """Well-known safe patterns should return before the memoized checks."""
+        _check_regex_pattern.cache_clear()
+        validate_pattern(r"\w+", use_regex=True)
+        assert _check_regex_pattern.cache_info().currsize == 0
+
+    def test_empty_string_skips_cache(self) -> None:
+        """Empty string should return before the memoized checks."""
+        _check_regex_pattern.cache_clear()
         validate_pattern("", use_regex=True)
-        validate_pattern("", use_regex=False)
+        assert _check_regex_pattern.cache_info().currsize == 0
 
     def test_max_pattern_length_constant(self) -> None:
         """MAX_PATTERN_LENGTH should be 500."""
         assert MAX_PATTERN_LENGTH == 500
+
+
+class TestValidationCache:
+    """Test memoization of validation outcomes."""
+
+    def test_repeated_validation_uses_cache(self) -> None:
+        """Validating the same pattern twice should hit the cache."""
+        _check_regex_pattern.cache_clear()
+        validate_pattern("cached+pattern", use_regex=True)
+        validate_pattern("cached+pattern", use_regex=True)
+        assert _check_regex_pattern.cache_info().hits == 1
+
+    def test_cached_rejection_still_raises(self) -> None:
+        """A cached rejection should raise a fresh error on every call."""
+        raised = []
+        for _ in range(2):
+            with pytest.raises(RegexValidationError, match="nested quantifiers detected") as exc:
+                validate_pattern("(b+)+", use_regex=True)
+            raised.append(exc.value)
+        assert raised[0] is not raised[1]
+
+    def test_cached_syntax_rejection_has_no_chained_error(self) -> None:
+        """Syntax rejections should not chain the internal regex.error."""
+        for _ in range(2):
+            with pytest.raises(RegexValidationError, match="Invalid regex syntax") as exc:
+                validate_pattern("(unclosed", use_regex=True)
+            assert exc.value.__context__ is None
+            assert exc.value.__cause__ is None
+
+    def test_overlong_pattern_not_cached(self) -> None:
+        """Patterns rejected on length should never enter the cache."""
+        _check_regex_pattern.cache_clear()
+        with pytest.raises(RegexValidationError):
+            validate_pattern("a" * (MAX_PATTERN_LENGTH + 1), use_regex=True)
+        assert _check_regex_pattern.cache_info().currsize == 0
+
+
+class TestBatchValidation:
+    """Test validating multiple patterns at once."""
+
+    def test_all_valid_patterns_pass(self) -> None:
+        """A batch of valid patterns should pass."""
+        validate_patterns(["a+b+", "[a-z]+", "a+b+"], use_regex=True)
+
+    def test_invalid_pattern_in_batch_rejected(self) -> None:
+        """Any invalid pattern in the batch should raise."""
+        with pytest.raises(RegexValidationError, match="nested quantifiers detected"):
+            validate_patterns(["[a-z]+", "(a+)+", "[invalid"], use_regex=True)
+
+    def test_duplicates_validated_once(self) -> None:
+        """Repeated patterns should only be checked once per batch."""
+        _check_regex_pattern.cache_clear()
+        validate_patterns(["dup+", "dup+", "dup+"], use_regex=True)
+        info = _check_regex_pattern.cache_info()
+        assert info.misses == 1
+        assert info.hits == 0
+
+    def test_non_regex_mode_skips_batch(self) -> None:
+        """Non-regex mode should skip validation for the whole batch."""
+        validate_patterns(["(a+)+", "[invalid"], use_regex=False)
+
+
+class TestBytesValidation:
+    """Test validating patterns given as bytes."""
+
+    @pytest.mark.parametrize("pattern", [b"a+b+", rb"\w+", rb"[\x80-\xff]+", b""])
+    def test_valid_bytes_patterns_pass(self, pattern: bytes) -> None:
+        """Valid bytes patterns should pass."""
+        validate_pattern_bytes(pattern, use_regex=True)
+
+    def test_nested_quantifiers_rejected(self) -> None:
+        """Bytes patterns with nested quantifiers should be rejected."""
+        with pytest.raises(RegexValidationError, match="nested quantifiers detected"):
+            validate_pattern_bytes(b"(a+)+", use_regex=True)
+
+    @pytest.mark.parametrize("pattern", [b"(a|aa)*", b"(a|a)+", rb"(.|\s)*"])
+    def test_known_redos_patterns_rejected(self, pattern: bytes) -> None:
+        """Bytes patterns on the known ReDoS blocklist should be rejected."""
+        with pytest.raises(RegexValidationError, match="known ReDoS pattern"):
+            validate_pattern_bytes(pattern, use_regex=True)
+
+    def test_invalid_syntax_rejected(self) -> None:
+        """Bytes patterns with invalid syntax should be rejected."""
+        with pytest.raises(RegexValidationError, match="Invalid regex syntax"):
+            validate_pattern_bytes(b"(unclosed", use_regex=True)
+
+    def test_length_counts_bytes(self) -> None:
+        """The length limit applies to the byte length."""
+        with pytest.raises(RegexValidationError, match="Pattern exceeds maximum length"):
+            validate_pattern_bytes("é".encode() * 251, use_regex=True)
+
+    def test_non_regex_mode_skips_validation(self) -> None:
+        """Non-regex mode should skip validation for bytes too."""
+        validate_pattern_bytes(b"(a+)+", use_regex=False)
+
+
+class TestMakeValidator:
+    """Test validators specialized for a fixed use_regex value."""
+
+    def test_regex_validator_rejects_redos(self) -> None:
+        """The regex-mode validator applies the full checks."""
+        check = make_validator(use_regex=True)
+        check("a+b+")
+        with pytest.raises(RegexValidationError, match="nested quantifiers detected"):
+            check("(a+)+")
+
+    def test_literal_validator_accepts_everything(self) -> None:
+        """The literal-mode validator accepts any pattern."""
+        check = make_validator(use_regex=False)
+        for pattern in ["(a+)+", "[invalid", "a" * 1000]:
+            check(pattern)
@@ -6,12 +6,138 @@ This script verifies that all prerequisites and components are properly installe
 and configured for the Python MCP Agent Workshop.
 """
 
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+# Resolve the TOML parser once: tomllib on Python 3.11+, the toml package before that
+_toml_parser: ModuleType | None
+try:
+    import tomllib
+
+    _toml_parser = tomllib
+    _TOML_READ_MODE = "rb"
+except ImportError:
+    try:
+        import toml
+
+        _toml_parser = toml
+        _TOML_READ_MODE = "r"
+    except ImportError:
+        _toml_parser = None
+
+# Imports every module named on the command line and prints a JSON map of
+# module name to success, so all dependencies are checked in one interpreter.
+_IMPORT_CHECK_SCRIPT = """
+import importlib
+import json
+import sys
+
+status = {}
+for name in sys.argv[1:]:
+    try:
+        importlib.import_module(name)
+    except Exception:
+        status[name] = False
+    else:
+        status[name] = True
+print(json.dumps(status))
+"""
+
+# Smoke-tests server creation and a keyword search, printing a JSON map of
+# check name to [success, detail]. Runs from the project root.
+_SMOKE_TEST_SCRIPT = """
+import asyncio
+import json
 import os
-import subprocess
 import sys
 import tempfile
 from pathlib import Path
 
+# Add src to path (the script runs from the project root)
+sys.path.insert(0, "src")
+
+# Keep the search fixture in RAM where a writable tmpfs is available
+SHM_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+def check_server():
+    try:
+        from workshop_mcp.server import WorkshopMCPServer
+
+        WorkshopMCPServer()
+        return True, "Server created successfully"
+    except Exception as e:
+        return False, f"Server creation failed: {e}"
+
+
+async def check_keyword_search():
+    try:
+        from workshop_mcp.keyword_search import KeywordSearchTool
+
+        with tempfile.TemporaryDirectory(dir=SHM_DIR) as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "test.py").write_text('def hello():\\n    return "world"')
+
+            tool = KeywordSearchTool()
+            result = await tool.execute("world", [str(temp_path)])
+
+            if result["summary"]["total_occurrences"] > 0:
+                return True, "Keyword search working correctly"
+            return False, "No occurrences found in test"
+    except Exception as e:
+        return False, f"Keyword search test failed: {e}"
+
+
+results = {"server": check_server(), "keyword_search": asyncio.run(check_keyword_search())}
+print(json.dumps(results))
+"""
+
+# Files that must exist, relative to the project root
+REQUIRED_FILES: tuple[Path, ...] = tuple(
+    Path(file_path)
+    for file_path in (
+        "pyproject.toml",
+        "README.md",
+        "src/workshop_mcp/__init__.py",
+        "src/workshop_mcp/server.py",
+        "src/workshop_mcp/keyword_search.py",
+        "agents/keyword_analysis.toml",
+        "tests/__init__.py",
+        "tests/test_keyword_search.py",
+        ".gitignore",
+    )
+)
+_REQUIRED_PARENTS = frozenset(file_path.parent for file_path in REQUIRED_FILES)
+
+# Quiet run: only the final summary line is parsed, so skip tracebacks and the cache
+_PYTEST_ARGS = ("tests/", "-q", "--tb=no", "--no-header", "-p", "no:cacheprovider")
+
+# Outcome counts in pytest's final summary line ("3 failed, 188 passed in 2.1s")
+_PYTEST_OUTCOME_COUNT = re.compile(rb"(\d+) (passed|failed)\b")
+
+# Printed by poetry check --lock when poetry.lock no longer matches pyproject.toml
+_LOCK_DRIFT_MESSAGE = "pyproject.toml changed significantly since poetry.lock was last generated"
+
+# Records the poetry.lock hash and environment of the last successful install.
+_INSTALL_MARKER = Path(".verify_cache") / "install.json"
+
+# Output deferred by checks running concurrently, replayed in order once they finish.
+_pending_output: ContextVar[list[Callable[[], None]] | None] = ContextVar(
+    "_pending_output", default=None
+)
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -28,60 +154,163 @@ class Colors:
     END = "\033[0m"
 
 
+class _PlainColors(Colors):
+    """Empty color codes for output that is not a terminal."""
+
+    GREEN = RED = YELLOW = BLUE = MAGENTA = CYAN = WHITE = BOLD = UNDERLINE = END = ""
+
+
 class WorkshopVerifier:
     """Comprehensive verification system for the MCP workshop setup."""
 
     def __init__(self) -> None:
         """Initialize the verifier."""
         self.project_root = Path(__file__).parent
+        self.pyproject_path = self.project_root / "pyproject.toml"
+        self.lock_path = self.project_root / "poetry.lock"
+        self.agent_config_path = self.project_root / "agents" / "keyword_analysis.toml"
+        self.install_marker_path = self.project_root / _INSTALL_MARKER
+        # Skip ANSI codes when output is piped to a file or CI log
+        self._c: type[Colors] = Colors if sys.stdout.isatty() else _PlainColors
+        self._rule = f"{self._c.BOLD}{self._c.CYAN}{'=' * 60}{self._c.END}"
         self.results: list[tuple[str, bool, str]] = []
         self.errors: list[str] = []
+        self.passed_count = 0
+        self.failed_count = 0
+        self.skipped: list[tuple[str, str]] = []
+        # Prerequisites discovered by earlier checks, used to skip dependent checks
+        self.capabilities = {"poetry": False, "venv": False}
+        self._python_command: list[str] | None = None
+        self._python_lock = asyncio.Lock()
+        self._agent_config: dict[str, Any] | None = None
+        self._smoke_results: dict[str, tuple[bool, str]] | None = None
+        self._smoke_lock = asyncio.Lock()
+        self._command_cache: dict[tuple[Any, ...], asyncio.Future[tuple[bool, str]]] = {}
+
+    def _defer(self, func: Callable[..., None], *args: object) -> bool:
+        """Queue an output call if the current check's output is being buffered."""
+        pending = _pending_output.get()
+        if pending is None:
+            return False
+        pending.append(partial(func, *args))
+        return True
 
     def print_header(self, title: str) -> None:
         """Print a formatted section header."""
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 60}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{title.center(60)}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 60}{Colors.END}\n")
+        if self._defer(self.print_header, title):
+            return
+        print(f"\n{self._rule}")
+        print(f"{self._c.BOLD}{self._c.CYAN}{title.center(60)}{self._c.END}")
+        print(f"{self._rule}\n")
 
     def print_result(self, test_name: str, success: bool, message: str = "") -> None:
         """Print a test result with colored output."""
-        status_icon = f"{Colors.GREEN}✅{Colors.END}" if success else f"{Colors.RED}❌{Colors.END}"
+        if self._defer(self.print_result, test_name, success, message):
+            return
+
+        status_icon = (
+            f"{self._c.GREEN}✅{self._c.END}" if success else f"{self._c.RED}❌{self._c.END}"
+        )
         status_text = (
-            f"{Colors.GREEN}PASS{Colors.END}" if success else f"{Colors.RED}FAIL{Colors.END}"
+            f"{self._c.GREEN}PASS{self._c.END}" if success else f"{self._c.RED}FAIL{self._c.END}"
         )
 
         print(f"{status_icon} {test_name:<40} [{status_text}]")
 
         if message:
-            color = Colors.GREEN if success else Colors.RED
-            print(f"   {color}{message}{Colors.END}")
+            color = self._c.GREEN if success else self._c.RED
+            print(f"   {color}{message}{self._c.END}")
 
         self.results.append((test_name, success, message))
 
-        if not success:
+        if success:
+            self.passed_count += 1
+        else:
+            self.failed_count += 1
             self.errors.append(f"{test_name}: {message}")
 
-    def run_command(
-        self, command: list[str], capture_output: bool = True, timeout: int = 30
+    def print_skip(self, test_name: str, reason: str) -> None:
+        """Print a check skipped because a prerequisite is missing."""
+        if self._defer(self.print_skip, test_name, reason):
+            return
+
+        print(f"⏭️ {test_name:<40} [{self._c.YELLOW}SKIP{self._c.END}]")
+        print(f"   {self._c.YELLOW}{reason}{self._c.END}")
+        self.skipped.append((test_name, reason))
+
+    async def project_python(self) -> list[str]:
+        """Return the command prefix for the project's Poetry interpreter.
+
+        The interpreter path is looked up once with ``poetry env info --executable``
+        so later invocations skip ``poetry run``'s environment resolution. Falls back
+        to ``poetry run python`` if the lookup fails.
+        """
+        async with self._python_lock:
+            if self._python_command is None:
+                success, output = await self.run_command(["poetry", "env", "info", "--executable"])
+                executable = output.strip()
+                if success and Path(executable).is_file():
+                    self._python_command = [executable]
+                else:
+                    self._python_command = ["poetry", "run", "python"]
+            return self._python_command
+
+    async def run_command(
+        self,
+        command: list[str],
+        capture_output: bool = True,
+        timeout: int = 30,
+        stdin_text: str | None = None,
+        cacheable: bool = False,
+    ) -> tuple[bool, str]:
+        """Run a shell command and return success status and output.
+
+        Commands marked ``cacheable`` are read-only probes whose answer cannot change
+        during a run: they run at most once per verifier, and concurrent callers
+        share the same result.
+        """
+        if not cacheable:
+            return await self._spawn(command, capture_output, timeout, stdin_text)
+
+        key = (tuple(command), capture_output, timeout, stdin_text)
+        if key not in self._command_cache:
+            self._command_cache[key] = asyncio.ensure_future(
+                self._spawn(command, capture_output, timeout, stdin_text)
+            )
+        return await self._command_cache[key]
+
+    async def _spawn(
+        self,
+        command: list[str],
+        capture_output: bool,
+        timeout: int,
+        stdin_text: str | None,
     ) -> tuple[bool, str]:
-        """Run a shell command and return success status and output."""
+        """Run a command in the project root, enforcing the timeout."""
+        stream = asyncio.subprocess.PIPE if capture_output else None
+        stdin = asyncio.subprocess.PIPE if stdin_text is not None else None
         try:
-            result = subprocess.run(
-                command,
-                capture_output=capture_output,
-                text=True,
-                timeout=timeout,
-                cwd=self.project_root,
+            process = await asyncio.create_subprocess_exec(
+                *command, stdin=stdin, stdout=stream, stderr=stream, cwd=self.project_root
             )
-            return result.returncode == 0, result.stdout + result.stderr
-        except subprocess.TimeoutExpired:
-            return False, f"Command timed out after {timeout} seconds"
         except FileNotFoundError:
             return False, f"Command not found: {command[0]}"
         except Exception as e:
             return False, f"Error running command: {str(e)}"
 
-    def check_python_version(self) -> None:
+        try:
+            input_bytes = stdin_text.encode("utf-8") if stdin_text is not None else None
+            stdout, stderr = await asyncio.wait_for(process.communicate(input_bytes), timeout)
+        # asyncio.TimeoutError is distinct from the builtin on Python 3.10
+        except asyncio.TimeoutError:  # noqa: UP041
+            process.kill()
+            await process.wait()
+            return False, f"Command timed out after {timeout} seconds"
+
+        output = (stdout or b"") + (stderr or b"")
+        return process.returncode == 0, output.decode("utf-8", errors="replace")
+
+    async def check_python_version(self) -> None:
         """Verify Python version is 3.11 or higher."""
         self.print_header("Python Version Check")
 
@@ -97,73 +326,101 @@ class WorkshopVerifier:
         else:
             self.print_result("Python Version", False, f"Python {current_version} (requires 3.11+)")
 
-    def check_poetry_installation(self) -> None:
+    async def check_poetry_installation(self) -> None:
         """Verify Poetry is installed and functional."""
         self.print_header("Poetry Installation Check")
 
-        # Check if poetry command exists
-        success, output = self.run_command(["poetry", "--version"])
+        poetry_missing_message = (
+            "Poetry not found. Install from https://python-poetry.org/docs/#installation"
+        )
+        if shutil.which("poetry") is None:
+            self.print_result("Poetry Installation", False, poetry_missing_message)
+            return
+
+        # Probe the poetry command and its configuration together
+        (success, output), (config_success, _) = await asyncio.gather(
+            self.run_command(["poetry", "--version"], cacheable=True),
+            self.run_command(["poetry", "config", "--list"], cacheable=True),
+        )
 
         if success:
             version = output.strip()
             self.print_result("Poetry Installation", True, version)
+            self.capabilities["poetry"] = True
 
             # Check poetry configuration
-            success, output = self.run_command(["poetry", "config", "--list"])
-            if success:
+            if config_success:
                 self.print_result("Poetry Configuration", True, "Configuration accessible")
             else:
                 self.print_result("Poetry Configuration", False, "Cannot access configuration")
         else:
-            self.print_result(
-                "Poetry Installation",
-                False,
-                "Poetry not found. Install from https://python-poetry.org/docs/#installation",
-            )
+            self.print_result("Poetry Installation", False, poetry_missing_message)
 
-    def check_project_structure(self) -> None:
+    async def check_project_structure(self) -> None:
         """Verify the project structure is correct."""
         self.print_header("Project Structure Check")
 
-        required_files = [
-            "pyproject.toml",
-            "README.md",
-            "src/workshop_mcp/__init__.py",
-            "src/workshop_mcp/server.py",
-            "src/workshop_mcp/keyword_search.py",
-            "agents/keyword_analysis.toml",
-            "tests/__init__.py",
-            "tests/test_keyword_search.py",
-            ".gitignore",
-        ]
-
-        for file_path in required_files:
-            full_path = self.project_root / file_path
-            exists = full_path.exists()
-
-            self.print_result(f"File: {file_path}", exists, "Found" if exists else "Missing")
-
-    def check_dependencies(self) -> None:
+        # List each parent directory once instead of stat-ing every file
+        present: dict[Path, set[str]] = {}
+        for parent in _REQUIRED_PARENTS:
+            try:
+                with os.scandir(self.project_root / parent) as entries:
+                    present[parent] = {entry.name for entry in entries}
+            except OSError:
+                present[parent] = set()
+
+        for file_path in REQUIRED_FILES:
+            exists = file_path.name in present[file_path.parent]
+
+            self.print_result(
+                f"File: {file_path.as_posix()}", exists, "Found" if exists else "Missing"
+            )
+
+    async def check_dependencies(self) -> None:
         """Check if dependencies can be installed."""
         self.print_header("Dependency Installation Check")
 
         # Check if pyproject.toml exists
-        pyproject_path = self.project_root / "pyproject.toml"
-        if not pyproject_path.exists():
+        if not self.pyproject_path.exists():
             self.print_result("pyproject.toml", False, "File not found")
             return
 
-        # Try to install dependencies
-        success, output = self.run_command(["poetry", "install"], timeout=120)
+        # A stale lock file makes the install slow and then fail; report it up front
+        if not await self._lock_file_is_current():
+            self.print_result(
+                "Lock File",
+                False,
+                "poetry.lock is out of date with pyproject.toml. Run 'poetry lock' first",
+            )
+            return
+
+        # Skip the install when poetry.lock and the environment are unchanged
+        install_state = await self._install_state()
+        if install_state is not None and install_state == self._cached_install_state():
+            success, output = True, ""
+            install_message = "Environment matches poetry.lock (install skipped)"
+        else:
+            success, output = await self.run_command(["poetry", "install"], timeout=120)
+            install_message = "All dependencies installed"
+            if success:
+                # Recompute: on a fresh checkout the install is what creates the env
+                installed_state = await self._install_state()
+                if installed_state is not None:
+                    self._save_install_state(installed_state)
 
         if success:
-            self.print_result("Dependency Installation", True, "All dependencies installed")
+            self.print_result("Dependency Installation", True, install_message)
+            self.capabilities["venv"] = True
 
-            # Verify key dependencies are importable
+            # Verify key dependencies are importable in a single interpreter
             key_deps = ["mcp", "aiofiles", "pytest"]
+            _, output = await self.run_command(
+                [*await self.project_python(), "-c", _IMPORT_CHECK_SCRIPT, *key_deps]
+            )
+            import_status = self._parse_json_line(output)
 
             for dep in key_deps:
-                success, _ = self.run_command(["poetry", "run", "python", "-c", f"import {dep}"])
+                success = import_status.get(dep, False)
                 self.print_result(
                     f"Import {dep}",
                     success,
@@ -176,118 +433,108 @@ class WorkshopVerifier:
                 f"Installation failed: {output[:200]}...",
             )
 
-    def check_mcp_server_startup(self) -> None:
-        """Test if the MCP server can start up."""
-        self.print_header("MCP Server Startup Check")
+    async def _lock_file_is_current(self) -> bool:
+        """Check that poetry.lock matches pyproject.toml without resolving anything.
 
-        # Create a simple test script to check server startup
-        test_script = """
-import asyncio
-import sys
-from pathlib import Path
+        Only Poetry's drift message counts as stale. A missing lock file, a timeout,
+        an older Poetry without ``check --lock`` or any other error is inconclusive,
+        and the install goes ahead.
+        """
+        if not self.lock_path.is_file():
+            return True
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+        success, output = await self.run_command(["poetry", "check", "--lock"], timeout=10)
+        return success or _LOCK_DRIFT_MESSAGE not in output
 
-async def test_server():
-    try:
-        from workshop_mcp.server import WorkshopMCPServer
-        server = WorkshopMCPServer()
-        print("Server created successfully")
-        return True
-    except Exception as e:
-        print(f"Server creation failed: {e}")
-        return False
+    async def _install_state(self) -> dict[str, str] | None:
+        """Return the poetry.lock hash and environment path, or None if unavailable."""
+        if not self.lock_path.is_file():
+            return None
 
-if __name__ == "__main__":
-    result = asyncio.run(test_server())
-    sys.exit(0 if result else 1)
-"""
+        # Not cacheable: the answer changes once poetry install creates the environment
+        success, output = await self.run_command(["poetry", "env", "info", "--path"])
+        env_path = output.strip()
+        if not success or not Path(env_path).is_dir():
+            return None
 
-        # Write test script to temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(test_script)
-            test_script_path = f.name
+        lock_hash = hashlib.sha256(self.lock_path.read_bytes()).hexdigest()
+        return {"lock_sha256": lock_hash, "env_path": env_path}
 
+    def _cached_install_state(self) -> dict[str, str] | None:
+        """Return the install state recorded by the last successful install."""
         try:
-            success, output = self.run_command(["poetry", "run", "python", test_script_path])
+            return json.loads(self.install_marker_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
 
-            self.print_result(
-                "MCP Server Creation",
-                success,
-                ("Server can be instantiated" if success else f"Error: {output[:100]}..."),
-            )
-        finally:
-            os.unlink(test_script_path)
+    def _save_install_state(self, state: dict[str, str]) -> None:
+        """Record the install state so unchanged environments skip the install."""
+        marker = self.install_marker_path
+        try:
+            marker.parent.mkdir(exist_ok=True)
+            marker.write_text(json.dumps(state))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _parse_json_line(output: str) -> dict[str, Any]:
+        """Extract a check script's JSON status map from command output."""
+        for line in output.splitlines():
+            if line.startswith("{"):
+                try:
+                    return json.loads(line)
+                except json.JSONDecodeError:
+                    break
+        return {}
+
+    async def check_mcp_server_startup(self) -> None:
+        """Test if the MCP server can start up."""
+        self.print_header("MCP Server Startup Check")
 
-    def check_keyword_search_functionality(self) -> None:
+        success, detail = (await self._smoke_test())["server"]
+        self.print_result(
+            "MCP Server Creation",
+            success,
+            ("Server can be instantiated" if success else f"Error: {detail[:100]}..."),
+        )
+
+    async def check_keyword_search_functionality(self) -> None:
         """Test the keyword search functionality."""
         self.print_header("Keyword Search Functionality Check")
 
-        # Create a test script for keyword search
-        test_script = """
-import asyncio
-import sys
-import tempfile
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-async def test_keyword_search():
-    try:
-        from workshop_mcp.keyword_search import KeywordSearchTool
-
-        # Create temporary test directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test file
-            test_file = temp_path / "test.py"
-            test_file.write_text("def hello():\\n    return \\"world\\"")
-
-            # Test search
-            tool = KeywordSearchTool()
-            result = await tool.execute("world", [str(temp_path)])
-
-            # Verify result
-            if result["summary"]["total_occurrences"] > 0:
-                print("Keyword search working correctly")
-                return True
-            else:
-                print("No occurrences found in test")
-                return False
-
-    except Exception as e:
-        print(f"Keyword search test failed: {e}")
-        return False
-
-if __name__ == "__main__":
-    result = asyncio.run(test_keyword_search())
-    sys.exit(0 if result else 1)
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(test_script)
-            test_script_path = f.name
-
-        try:
-            success, output = self.run_command(["poetry", "run", "python", test_script_path])
+        success, detail = (await self._smoke_test())["keyword_search"]
+        self.print_result(
+            "Keyword Search Test",
+            success,
+            "Functionality working" if success else f"Error: {detail[:100]}...",
+        )
 
-            self.print_result(
-                "Keyword Search Test",
-                success,
-                "Functionality working" if success else f"Error: {output[:100]}...",
-            )
-        finally:
-            os.unlink(test_script_path)
+    async def _smoke_test(self) -> dict[str, tuple[bool, str]]:
+        """Run the server and keyword search smoke tests in one interpreter.
 
-    def run_unit_tests(self) -> None:
+        Both checks share the result, so the script runs only once per verifier.
+        """
+        async with self._smoke_lock:
+            if self._smoke_results is None:
+                _, output = await self.run_command(
+                    [*await self.project_python(), "-"], stdin_text=_SMOKE_TEST_SCRIPT
+                )
+                reported = self._parse_json_line(output)
+                self._smoke_results = {
+                    name: tuple(reported[name]) if name in reported else (False, output)
+                    for name in ("server", "keyword_search")
+                }
+            return self._smoke_results
+
+    async def run_unit_tests(self) -> None:
         """Run the unit test suite."""
         self.print_header("Unit Tests Check")
 
         # Check if pytest is available
-        success, output = self.run_command(["poetry", "run", "pytest", "--version"])
+        python = await self.project_python()
+        success, output = await self.run_command(
+            [*python, "-m", "pytest", "--version"], cacheable=True
+        )
 
         if not success:
             self.print_result("Pytest Availability", False, "Pytest not available")
@@ -296,28 +543,80 @@ if __name__ == "__main__":
         self.print_result("Pytest Availability", True, "Pytest available")
 
         # Run the tests
-        success, output = self.run_command(
-            ["poetry", "run", "pytest", "tests/", "-v", "--tb=short"], timeout=60
+        success, passed_count, total_count, output = await self._run_pytest(
+            [*python, "-m", "pytest", *_PYTEST_ARGS], timeout=60
         )
 
         if success:
-            # Count passed tests
-            lines = output.split("\n")
-            test_lines = [
-                line for line in lines if "::" in line and ("PASSED" in line or "FAILED" in line)
-            ]
-            passed_count = len([line for line in test_lines if "PASSED" in line])
-            total_count = len(test_lines)
-
             self.print_result("Unit Tests", success, f"{passed_count}/{total_count} tests passed")
         else:
             self.print_result("Unit Tests", False, f"Tests failed: {output[-200:]}")
 
-    def check_qodo_command(self) -> None:
+    async def _run_pytest(self, command: list[str], timeout: int) -> tuple[bool, int, int, str]:
+        """Run quiet pytest, keeping only the tail of its output.
+
+        Pass and fail counts come from pytest's final summary line, so per-test
+        output never needs to be held in memory or parsed.
+
+        Returns:
+            Success status, passed count, total count of passed and failed tests,
+            and the tail of the output for error reporting.
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self.project_root,
+                limit=2**20,
+            )
+        except FileNotFoundError:
+            return False, 0, 0, f"Command not found: {command[0]}"
+        except Exception as e:
+            return False, 0, 0, f"Error running command: {str(e)}"
+
+        tail: deque[bytes] = deque(maxlen=10)
+
+        async def consume() -> int:
+            if process.stdout is not None:
+                async for line in process.stdout:
+                    if line.strip():
+                        tail.append(line)
+            return await process.wait()
+
+        try:
+            returncode = await asyncio.wait_for(consume(), timeout)
+        # asyncio.TimeoutError is distinct from the builtin on Python 3.10
+        except asyncio.TimeoutError:  # noqa: UP041
+            process.kill()
+            await process.wait()
+            return False, 0, 0, f"Command timed out after {timeout} seconds"
+        except Exception as e:
+            # e.g. a line longer than the stream limit; stop pytest and report the failure
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            return False, 0, 0, f"Error running command: {str(e)}"
+
+        counts = {b"passed": 0, b"failed": 0}
+        if tail:
+            for count, outcome in _PYTEST_OUTCOME_COUNT.findall(tail[-1]):
+                counts[outcome] = int(count)
+        passed = counts[b"passed"]
+        total = passed + counts[b"failed"]
+
+        output = b"".join(tail).decode("utf-8", errors="replace")
+        return returncode == 0, passed, total, output
+
+    async def check_qodo_command(self) -> None:
         """Check if Qodo command is available."""
         self.print_header("Qodo Command Check")
 
-        success, output = self.run_command(["qodo", "--version"])
+        # Only spawn qodo for its version once PATH says it exists
+        if shutil.which("qodo") is None:
+            success, output = False, ""
+        else:
+            success, output = await self.run_command(["qodo", "--version"], cacheable=True)
 
         if success:
             self.print_result("Qodo Command", True, f"Available: {output.strip()}")
@@ -328,24 +627,23 @@ if __name__ == "__main__":
                 "Not found. Install from https://docs.qodo.ai/installation",
             )
 
-    def check_agent_configuration(self) -> None:
+    async def check_agent_configuration(self) -> None:
         """Verify agent configuration file is valid."""
         self.print_header("Agent Configuration Check")
 
-        agent_config_path = self.project_root / "agents" / "keyword_analysis.toml"
-
-        if not agent_config_path.exists():
+        if not self.agent_config_path.exists():
             self.print_result("Agent Config File", False, "keyword_analysis.toml not found")
             return
 
         self.print_result("Agent Config File", True, "keyword_analysis.toml found")
 
+        if _toml_parser is None:
+            self.print_result("TOML Parsing", False, "toml library not available")
+            return
+
         # Try to parse TOML
         try:
-            import tomllib
-
-            with open(agent_config_path, "rb") as f:
-                config = tomllib.load(f)
+            config = self._load_agent_config()
 
             # Check required sections for the new TOML structure
             required_sections = ["commands", "commands.keyword_analysis"]
@@ -382,74 +680,110 @@ if __name__ == "__main__":
                 else:
                     self.print_result(f"Top-level Field: {field}", False, "Missing")
 
-        except ImportError:
-            # Fallback for Python < 3.11
-            try:
-                import toml
-
-                with open(agent_config_path) as f:
-                    config = toml.load(f)
-                self.print_result("TOML Parsing", True, "Configuration valid")
-            except ImportError:
-                self.print_result("TOML Parsing", False, "toml library not available")
-            except Exception as e:
-                self.print_result("TOML Parsing", False, f"Parse error: {str(e)}")
         except Exception as e:
             self.print_result("TOML Parsing", False, f"Parse error: {str(e)}")
 
+    def _load_agent_config(self) -> dict[str, Any]:
+        """Parse the agent configuration file, reusing the result on later calls."""
+        if self._agent_config is None:
+            if _toml_parser is None:
+                raise RuntimeError("toml library not available")
+            with open(self.agent_config_path, _TOML_READ_MODE) as f:
+                self._agent_config = _toml_parser.load(f)
+        return self._agent_config
+
     def generate_summary(self) -> None:
         """Generate and display verification summary."""
         self.print_header("Verification Summary")
 
-        total_tests = len(self.results)
-        passed_tests = sum(1 for _, success, _ in self.results if success)
-        failed_tests = total_tests - passed_tests
+        passed_tests = self.passed_count
+        failed_tests = self.failed_count
+        total_tests = passed_tests + failed_tests
 
-        print(f"{Colors.BOLD}Total Tests: {total_tests}{Colors.END}")
-        print(f"{Colors.GREEN}Passed: {passed_tests}{Colors.END}")
-        print(f"{Colors.RED}Failed: {failed_tests}{Colors.END}")
+        print(f"{self._c.BOLD}Total Tests: {total_tests}{self._c.END}")
+        print(f"{self._c.GREEN}Passed: {passed_tests}{self._c.END}")
+        print(f"{self._c.RED}Failed: {failed_tests}{self._c.END}")
+        if self.skipped:
+            print(f"{self._c.YELLOW}Skipped: {len(self.skipped)}{self._c.END}")
 
         success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-        print(f"{Colors.BOLD}Success Rate: {success_rate:.1f}%{Colors.END}")
+        print(f"{self._c.BOLD}Success Rate: {success_rate:.1f}%{self._c.END}")
 
         if failed_tests > 0:
-            print(f"\n{Colors.RED}{Colors.BOLD}Issues Found:{Colors.END}")
+            print(f"\n{self._c.RED}{self._c.BOLD}Issues Found:{self._c.END}")
             for i, error in enumerate(self.errors, 1):
-                print(f"{Colors.RED}{i}. {error}{Colors.END}")
+                print(f"{self._c.RED}{i}. {error}{self._c.END}")
 
-            print(f"\n{Colors.YELLOW}{Colors.BOLD}Next Steps:{Colors.END}")
-            print(f"{Colors.YELLOW}1. Review the failed checks above{Colors.END}")
-            print(f"{Colors.YELLOW}2. Install missing dependencies{Colors.END}")
-            print(f"{Colors.YELLOW}3. Fix configuration issues{Colors.END}")
-            print(f"{Colors.YELLOW}4. Re-run this verification script{Colors.END}")
+            print(f"\n{self._c.YELLOW}{self._c.BOLD}Next Steps:{self._c.END}")
+            print(f"{self._c.YELLOW}1. Review the failed checks above{self._c.END}")
+            print(f"{self._c.YELLOW}2. Install missing dependencies{self._c.END}")
+            print(f"{self._c.YELLOW}3. Fix configuration issues{self._c.END}")
+            print(f"{self._c.YELLOW}4. Re-run this verification script{self._c.END}")
         else:
             print(
-                f"\n{Colors.GREEN}{Colors.BOLD}🎉 All checks passed! Workshop setup is complete.{Colors.END}"
+                f"\n{self._c.GREEN}{self._c.BOLD}🎉 All checks passed! Workshop setup is complete.{self._c.END}"
             )
-            print(f"\n{Colors.CYAN}{Colors.BOLD}You can now proceed with the workshop:{Colors.END}")
             print(
-                f"{Colors.CYAN}1. Start the MCP server: poetry run workshop-mcp-server{Colors.END}"
+                f"\n{self._c.CYAN}{self._c.BOLD}You can now proceed with the workshop:{self._c.END}"
             )
-            print(f"{Colors.CYAN}2. Run tests: poetry run pytest{Colors.END}")
-            print(f"{Colors.CYAN}3. Use the agent: qodo keyword_analysis{Colors.END}")
-
-    def run_all_checks(self) -> bool:
+            print(
+                f"{self._c.CYAN}1. Start the MCP server: poetry run workshop-mcp-server{self._c.END}"
+            )
+            print(f"{self._c.CYAN}2. Run tests: poetry run pytest{self._c.END}")
+            print(f"{self._c.CYAN}3. Use the agent: qodo keyword_analysis{self._c.END}")
+
+    async def _run_buffered(self, check: Callable[[], Awaitable[None]]) -> list[Callable[[], None]]:
+        """Run a check while buffering its output, and return the buffered calls."""
+        pending: list[Callable[[], None]] = []
+        _pending_output.set(pending)
+        await check()
+        return pending
+
+    async def _run_concurrently(self, *checks: Callable[[], Awaitable[None]]) -> None:
+        """Run checks concurrently, then print their output in the order given."""
+        outputs = await asyncio.gather(*(self._run_buffered(check) for check in checks))
+        for pending in outputs:
+            for flush in pending:
+                flush()
+
+    async def run_all_checks(self) -> bool:
         """Run all verification checks."""
-        print(f"{Colors.BOLD}{Colors.MAGENTA}")
+        print(f"{self._c.BOLD}{self._c.MAGENTA}")
         print("🔧 Workshop MCP Verification Script")
         print("===================================")
-        print(f"{Colors.END}")
-
-        # Run all checks
-        self.check_python_version()
-        self.check_poetry_installation()
-        self.check_project_structure()
-        self.check_dependencies()
-        self.check_mcp_server_startup()
-        self.check_keyword_search_functionality()
-        self.run_unit_tests()
-        self.check_qodo_command()
-        self.check_agent_configuration()
+        print(f"{self._c.END}")
+
+        await self.check_python_version()
+
+        # Independent checks run together. Checks that need Poetry, or code running
+        # inside the installed environment, are skipped if the prerequisite failed.
+        await self._run_concurrently(
+            self.check_poetry_installation,
+            self.check_project_structure,
+            self.check_qodo_command,
+            self.check_agent_configuration,
+        )
+
+        if self.capabilities["poetry"]:
+            await self.check_dependencies()
+        else:
+            self.print_header("Dependency Installation Check")
+            self.print_skip("Dependency Installation", "Poetry is not available")
+
+        if self.capabilities["venv"]:
+            await self._run_concurrently(
+                self.check_mcp_server_startup,
+                self.check_keyword_search_functionality,
+                self.run_unit_tests,
+            )
+        else:
+            for title, test_name in (
+                ("MCP Server Startup Check", "MCP Server Creation"),
+                ("Keyword Search Functionality Check", "Keyword Search Test"),
+                ("Unit Tests Check", "Unit Tests"),
+            ):
+                self.print_header(title)
+                self.print_skip(test_name, "Dependencies are not installed")
 
         # Generate summary
         self.generate_summary()
@@ -461,7 +795,7 @@ if __name__ == "__main__":
 def main() -> None:
     """Main entry point for the verification script."""
     verifier = WorkshopVerifier()
-    success = verifier.run_all_checks()
+    success = asyncio.run(verifier.run_all_checks())
 
     sys.exit(0 if success else 1)
 